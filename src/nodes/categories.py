@@ -0,0 +1,28 @@
+"""Node categories."""
+
+# Python imports
+from typing import Final
+
+# 3rd party imports
+import knime.extension as knext
+
+
+_CATEGORY_SPECS: Final[dict[str, tuple[str, str]]] = {
+    'config': ('Instance Selection', 'MdH Instance Selection Nodes.'),
+    'utility': ('Utility', 'MdH Utility Nodes.'),
+    'harvest': ('Harvest', 'MdH Harvest Nodes.'),
+    'query': ('Query', 'MdH Query Nodes.'),
+    'statistics': ('Statistics', 'MdH Statistic Nodes.'),
+}
+
+
+CATEGORIES: Final[dict] = {
+    level_id: knext.category(
+        path='/community/mdh',
+        level_id=level_id,
+        name=name,
+        description=description,
+        icon='icons/mdh.png',
+    )
+    for level_id, (name, description) in _CATEGORY_SPECS.items()
+}
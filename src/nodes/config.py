@@ -7,7 +7,7 @@ import logging
 import knime.extension as knext
 
 # Local imports
-import mdh
+from .categories import CATEGORIES
 from ports.instance_connection import (
     INSTANCE_CONNECTION_TYPE,
     MdHInstanceConnectionPortObject,
@@ -16,6 +16,7 @@ from ports.instance_connection import (
 from utils.mdh import (  # noqa[I100,I201]
     get_running_mdh_core_names,
     get_running_mdh_global_search_names,
+    invalidate_discovery_cache,
     mdh_instance_is_running,
     split_global_search_cores
 )
@@ -26,13 +27,9 @@ from utils.parameter import FlowVariables
 LOGGER = logging.getLogger(__name__)
 
 
-__category = knext.category(
-    path='/community/mdh',
-    level_id='config',
-    name='Instance Selection',
-    description='MdH Instance Selection Nodes.',
-    icon='icons/mdh.png',
-)
+__category = CATEGORIES['config']
+
+_CONNECTION_SPEC = MdHInstanceConnectionPortObjectSpec(INSTANCE_CONNECTION_TYPE.id)
 
 
 ####################
@@ -40,13 +37,18 @@ __category = knext.category(
 ####################
 
 
+def get_default_selected_cores(_) -> str:
+    """Get all running MdH Core Instances as default core selection."""
+    return ', '.join(get_running_mdh_core_names())
+
+
 @knext.parameter_group(label='Instance Selection')
 class CoreInstance:  # noqa[D101]
 
     core = knext.StringParameter(
         'MdH Core Instances',
         'Select a MdH Core Instance.',
-        enum=get_running_mdh_core_names()
+        choices=lambda _: get_running_mdh_core_names()
     )
 
 
@@ -56,12 +58,12 @@ class GlobalSearchInstance:  # noqa[D101]
     global_search = knext.StringParameter(
         'MdH Global Search Instances',
         'Select a MdH Global Search Instance.',
-        enum=get_running_mdh_global_search_names()
+        choices=lambda _: get_running_mdh_global_search_names()
     )
     selected_cores = knext.StringParameter(
         'Included MdH Core Instances',
         'Provide a comma seperated list of included MdH Core Instances',
-        default_value=', '.join(core for core in get_running_mdh_core_names())
+        default_value=get_default_selected_cores
     )
 
 
@@ -106,12 +108,11 @@ class CoreConfigurationNode(knext.PythonNode):
 
     def configure(self, config_context: knext.ConfigurationContext):
         """Node configuration."""
-        cores = mdh.core.main.get(only_running=True)
-        if not cores:
-            LOGGER.warning(f' {Messages.ADD_RUNNING_CORE}')
+        if not get_running_mdh_core_names():
+            LOGGER.warning(' %s', Messages.ADD_RUNNING_CORE)
             config_context.set_warning(Messages.ADD_RUNNING_CORE)
 
-        return MdHInstanceConnectionPortObjectSpec(INSTANCE_CONNECTION_TYPE.id)
+        return _CONNECTION_SPEC
 
     def execute(self, exec_context: knext.ExecutionContext):
         """Node execution."""
@@ -123,7 +124,7 @@ class CoreConfigurationNode(knext.PythonNode):
             )
 
         return MdHInstanceConnectionPortObject(
-            MdHInstanceConnectionPortObjectSpec(INSTANCE_CONNECTION_TYPE.id),
+            _CONNECTION_SPEC,
             {
                 FlowVariables.INSTANCE: self.instance.core
             }
@@ -153,12 +154,11 @@ class GlobalSearchConfigurationNode(knext.PythonNode):
 
     def configure(self, config_context: knext.ConfigurationContext):
         """Node configuration."""
-        global_searches = mdh.global_search.main.get(only_running=True)
-        if not global_searches:
-            LOGGER.warning(f' {Messages.ADD_RUNNING_GLOBAL_SEARCH}')
+        if not get_running_mdh_global_search_names():
+            LOGGER.warning(' %s', Messages.ADD_RUNNING_GLOBAL_SEARCH)
             config_context.set_warning(Messages.ADD_RUNNING_GLOBAL_SEARCH)
 
-        return MdHInstanceConnectionPortObjectSpec(INSTANCE_CONNECTION_TYPE.id)
+        return _CONNECTION_SPEC
 
     def execute(self, exec_context: knext.ExecutionContext):
         """Node execution."""
@@ -173,11 +173,11 @@ class GlobalSearchConfigurationNode(knext.PythonNode):
             )
 
         cores = split_global_search_cores(self.instance.selected_cores)
-        running_cores = [
-            core.name
-            for core in
-            mdh.core.main.get(only_running=True)
-        ]
+        running_cores = set(get_running_mdh_core_names())
+        if not running_cores.issuperset(cores):
+            # Re-check against a fresh discovery before rejecting any core
+            invalidate_discovery_cache()
+            running_cores = set(get_running_mdh_core_names())
         for core in cores:
             if core not in running_cores:
                 raise RuntimeError(
@@ -185,7 +185,7 @@ class GlobalSearchConfigurationNode(knext.PythonNode):
                 )
 
         return MdHInstanceConnectionPortObject(
-            MdHInstanceConnectionPortObjectSpec(INSTANCE_CONNECTION_TYPE.id),
+            _CONNECTION_SPEC,
             {
                 FlowVariables.INSTANCE: self.instance.global_search,
                 FlowVariables.SELECTED_CORES: cores,
@@ -8,16 +8,14 @@ from pathlib import Path
 import knime.extension as knext
 
 # Local imports
+from .categories import CATEGORIES
 import mdh
 from ports.instance_connection import (
     INSTANCE_CONNECTION_TYPE,
     MdHInstanceConnectionPortObject,
     MdHInstanceConnectionPortObjectSpec
 )
-from utils.mdh import (  # noqa[I100,I201]
-    mdh_instance_is_global_search,
-    mdh_instance_is_running
-)
+from utils.mdh import mdh_instance_status  # noqa[I100,I201]
 from utils.message import Messages
 from utils.parameter import FlowVariables
 from utils.paths import is_absolute_file_path
@@ -25,13 +23,7 @@ from utils.paths import is_absolute_file_path
 LOGGER = logging.getLogger(__name__)
 
 
-__category = knext.category(
-    path='/community/mdh',
-    level_id='harvest',
-    name='Harvest',
-    description='MdH Harvest Nodes.',
-    icon='icons/mdh.png',
-)
+__category = CATEGORIES['harvest']
 
 
 ####################
@@ -90,7 +82,7 @@ class HarvestNode(knext.PythonNode):
     ):
         """Node configuration."""
         if not is_absolute_file_path(Path(self.parameter.input_task_file)):
-            LOGGER.warning(f' {Messages.EXISTING_GRAPHQL_FILE}')
+            LOGGER.warning(' %s', Messages.EXISTING_GRAPHQL_FILE)
             config_context.set_warning(Messages.EXISTING_GRAPHQL_FILE)
 
         return None
@@ -103,20 +95,18 @@ class HarvestNode(knext.PythonNode):
         """Node execution."""
         instance = mdh_connection.data[FlowVariables.INSTANCE]
 
-        is_global_search = mdh_instance_is_global_search(instance)
-        if is_global_search:
+        status = mdh_instance_status(instance)
+        if status.is_global_search:
             raise RuntimeError(Messages.HARVEST_GLOBAL_SEARCH)
-
-        # Note: is_global_search == False
-        if not mdh_instance_is_running(instance, is_global_search):
+        if not status.is_running:
             raise RuntimeError(
                 Messages.ADD_RUNNING_CORE_BY_NAME.format(core=instance)
             )
-        if not is_absolute_file_path(Path(self.parameter.input_task_file)):
+        task_file = Path(self.parameter.input_task_file)
+        if not is_absolute_file_path(task_file):
             raise RuntimeError(Messages.EXISTING_GRAPHQL_FILE)
 
-        task_id = \
-            mdh.core.harvest.schedule_add(instance, Path(self.parameter.input_task_file))
+        task_id = mdh.core.harvest.schedule_add(instance, task_file)
 
         if self.parameter.blocking:
             exec_context.set_progress(
@@ -1,16 +1,17 @@
 """Query nodes."""
 
 # Python imports
-import itertools
-import json
 import logging
+import os
 from pathlib import Path
 
 # 3rd party imports
 import knime.extension as knext
-import pandas as pd
+import orjson
+import pyarrow as pa
 
 # Local imports
+from .categories import CATEGORIES
 import mdh
 from mdh.types.query import (
     DownloadFormat,
@@ -32,8 +33,7 @@ from ports.metadata_query import (
 from utils.mdh import (  # noqa[I100,I201]
     get_global_search_headers,
     mdh_download_format_exists,
-    mdh_instance_is_global_search,
-    mdh_instance_is_running
+    mdh_instance_status
 )
 from utils.message import Messages
 from utils.parameter import FlowVariables
@@ -42,13 +42,7 @@ from utils.parameter import FlowVariables
 LOGGER = logging.getLogger(__name__)
 
 
-__category = knext.category(
-    path='/community/mdh',
-    level_id='query',
-    name='Query',
-    description='MdH Query Nodes.',
-    icon='icons/mdh.png',
-)
+__category = CATEGORIES['query']
 
 ####################
 # Parameter Groups #
@@ -71,27 +65,41 @@ class Output:  # noqa[D101]
     )
 
 
+def validate_output(output: Output) -> str | None:
+    """Validate the output configuration.
+
+    :param output: the output parameter group
+    :returns: the message of the first failed check, None if the configuration is valid
+    """
+    checks = (
+        (mdh_download_format_exists(output.download_format), Messages.QUERY_VALID_DOWNLOAD_FORMAT),
+        (os.path.isabs(output.output_result_file), Messages.QUERY_VALID_OUTPUT_FILE),
+    )
+    return next((message for is_valid, message in checks if not is_valid), None)
+
+
 ########################
 # Metadata Query Nodes #
 ########################
 
 
+_VALUE_TYPE_MAP = {
+    'DATE': 'TS',
+    'NUMBER': 'NUM'
+}
+
+
 def create_query_parameter(query_config: dict) -> QueryParameters:
     """Get query parameter from query creator dict."""
-    filter_functions = []
-    for filter in query_config['filters']:
-        value_type = 'STR'
-        if filter['value_type'] == 'DATE':
-            value_type = 'TS'
-        if filter['value_type'] == 'NUMBER':
-            value_type = 'NUM'
-
-        filter_functions.append(QueryFilter(
+    filter_functions = [
+        QueryFilter(
             filter['tag'],
             filter['operation'],
             filter['target'],
-            value_type
-        ))
+            _VALUE_TYPE_MAP.get(filter['value_type'], 'STR')
+        )
+        for filter in query_config['filters']
+    ]
 
     query_parameter = QueryParameters(
         filter_functions=filter_functions,
@@ -139,12 +147,10 @@ class MdHExecuteQueryToFileNode(knext.PythonNode):
         __: MdHMetadataQueryPortObjectSpec
     ):
         """Node configuration."""
-        if not mdh_download_format_exists(self.output.download_format):
-            LOGGER.warning(f' {Messages.QUERY_VALID_DOWNLOAD_FORMAT}')
-            config_context.set_warning(Messages.QUERY_VALID_DOWNLOAD_FORMAT)
-        elif not Path(self.output.output_result_file).is_absolute():
-            LOGGER.warning(f' {Messages.QUERY_VALID_OUTPUT_FILE}')
-            config_context.set_warning(Messages.QUERY_VALID_OUTPUT_FILE)
+        error = validate_output(self.output)
+        if error is not None:
+            LOGGER.warning(' %s', error)
+            config_context.set_warning(error)
 
         return None
 
@@ -158,19 +164,20 @@ class MdHExecuteQueryToFileNode(knext.PythonNode):
         instance = mdh_connection.data[FlowVariables.INSTANCE]
         query_config = mdh_query.data[FlowVariables.QUERY]
 
-        is_global_search = mdh_instance_is_global_search(instance)
-        if not mdh_instance_is_running(instance, is_global_search):
+        # Run the local checks before probing the MdH Instance
+        error = validate_output(self.output)
+        if error is not None:
+            raise RuntimeError(error)
+
+        is_global_search, is_running = mdh_instance_status(instance)
+        if not is_running:
             raise RuntimeError(
                 Messages.ADD_RUNNING_INSTANCE_BY_NAME.format(instance=instance)
             )
-        if not mdh_download_format_exists(self.output.download_format):
-            raise RuntimeError(Messages.QUERY_VALID_DOWNLOAD_FORMAT)
-        if not Path(self.output.output_result_file).is_absolute():
-            raise RuntimeError(Messages.QUERY_VALID_OUTPUT_FILE)
 
         query_parameter = create_query_parameter(query_config)
         query_output = QueryOutput(
-            getattr(DownloadFormat, self.output.download_format.upper()),
+            DownloadFormat(self.output.download_format),
             StreamedOutput(
                 False,
                 Path(self.output.output_result_file)
@@ -248,8 +255,8 @@ class MdHExecuteQueryToStringNode(knext.PythonNode):
         instance = mdh_connection.data[FlowVariables.INSTANCE]
         query_config = mdh_query.data[FlowVariables.QUERY]
 
-        is_global_search = mdh_instance_is_global_search(instance)
-        if not mdh_instance_is_running(instance, is_global_search):
+        is_global_search, is_running = mdh_instance_status(instance)
+        if not is_running:
             raise RuntimeError(
                 Messages.ADD_RUNNING_INSTANCE_BY_NAME.format(instance=instance)
             )
@@ -283,31 +290,28 @@ class MdHExecuteQueryToStringNode(knext.PythonNode):
         source_files = []
         tags = []
         values = []
-        for file in json.loads(result)['data']['mdhSearch']['files']:
+        for file in orjson.loads(result)['data']['mdhSearch']['files']:
             instance = file['instanceName']
-            metadata = file['metadata']
-            source_file = next(
-                itertools.dropwhile(
-                    lambda entry: entry['name'] != 'SourceFile',
-                    metadata
-                )
-            )['value']
-
-            for entry in metadata:
-                if exclude_source_file_tag and entry['name'] == 'SourceFile':
-                    continue
-
-                instances.append(instance)
-                source_files.append(source_file)
+            source_file = None
+
+            for entry in file['metadata']:
+                if entry['name'] == 'SourceFile':
+                    source_file = entry['value']
+                    if exclude_source_file_tag:
+                        continue
+
                 tags.append(entry['name'])
                 values.append(entry['value'])
 
-        table = {
-            'Instance': instances,
-            'SourceFile': source_files,
-            'Tag': tags,
-            'Value': values
-        }
-        return knext.Table.from_pandas(
-            pd.DataFrame(table)
-        )
+            # Instance and SourceFile are identical for all rows of a file
+            num_rows = len(tags) - len(instances)
+            instances.extend([instance] * num_rows)
+            source_files.extend([source_file] * num_rows)
+
+        table = pa.table({
+            'Instance': pa.array(instances, type=pa.string()),
+            'SourceFile': pa.array(source_files, type=pa.string()),
+            'Tag': pa.array(tags, type=pa.string()),
+            'Value': pa.array(values, type=pa.string())
+        })
+        return knext.Table.from_pyarrow(table)
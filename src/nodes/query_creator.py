@@ -1,7 +1,6 @@
 """Query Creator node."""
 
 # Python imports
-import contextlib
 import logging
 import re
 from dataclasses import dataclass
@@ -12,7 +11,7 @@ import knime.extension as knext
 from mdh.types.query._parameters._base import DEFAULT_SELECTED_TAGS
 
 # Local imports
-from .query import __category
+from .categories import CATEGORIES
 from ports.metadata_query import (
     MdHMetadataQueryPortObject,
     MdHMetadataQueryPortObjectSpec,
@@ -25,9 +24,23 @@ from utils.message import Messages
 LOGGER = logging.getLogger(__name__)
 
 
+__category = CATEGORIES['query']
+
+
 class TagIsNotEmpty(knext.Condition):
     """A Condition that evaluates to true if the property tag is not empty."""
 
+    # The schema does not depend on the subject and is shared by all instances
+    _SCHEMA = {
+        'properties': {
+            'tag': {
+                'not': {
+                    'const': ''
+                }
+            }
+        }
+    }
+
     def __init__(self, subject) -> None:
         """A Condition that evaluates to true if the property tag is not empty."""
         super().__init__()
@@ -37,15 +50,7 @@ class TagIsNotEmpty(knext.Condition):
         """Converts the Condition into a dict that is JSON serializable."""
         return {
             'scope': str(find_scope(self._subject)),
-            'schema': {
-                'properties': {
-                    'tag': {
-                        'not': {
-                            'const': ''
-                        }
-                    }
-                }
-            }
+            'schema': self._SCHEMA
         }
 
     @property
@@ -102,6 +107,14 @@ class KnimeToMdHOperationsMap(StrEnum):
     VALUE_IS_SMALLER = 'SMALLER'
 
 
+# Name of the filter's parameter group holding the operation of a tag type
+_VALUE_TYPE_GROUPS = {
+    TagTypeOptions.STRING.name: 'string',
+    TagTypeOptions.NUMBER.name: 'number',
+    TagTypeOptions.DATE.name: 'date',
+}
+
+
 class StringOperationOptions(knext.EnumParameterOptions):
     """Available filter operations for strings."""
 
@@ -222,6 +235,13 @@ def inject_date_parameters(date):
     date.target = target
 
 
+# Shared decorators for the per-filter type groups, the decorated classes stay
+# distinct per filter as knext attaches the group state to them
+_DATE_GROUP = knext.parameter_group(label='Date')
+_NUMBER_GROUP = knext.parameter_group(label='Number')
+_STRING_GROUP = knext.parameter_group(label='String')
+
+
 def inject_filter_parameters(filter, filter_idx):
     """Inject filter parameters."""
     value_type = knext.EnumParameter(
@@ -237,9 +257,7 @@ def inject_filter_parameters(filter, filter_idx):
         'e.g. **SourceFile**, **FileName**, **FileSize**, **FileType**, **FileAccessDate**, ...'
     )
 
-    date_type = type(f'Date{filter_idx}', (), {})
-    decorator_cls = knext.parameter_group(label='Date')
-    date = decorator_cls(date_type)()
+    date = _DATE_GROUP(type(f'Date{filter_idx}', (), {}))()
     inject_date_parameters(date)
     date.rule(
         knext.OneOf(
@@ -249,9 +267,7 @@ def inject_filter_parameters(filter, filter_idx):
         knext.Effect.SHOW
     )
 
-    number_type = type(f'Number{filter_idx}', (), {})
-    decorator_cls = knext.parameter_group(label='Number')
-    number = decorator_cls(number_type)()
+    number = _NUMBER_GROUP(type(f'Number{filter_idx}', (), {}))()
     inject_number_parameters(number)
     number.rule(
         knext.OneOf(
@@ -261,9 +277,7 @@ def inject_filter_parameters(filter, filter_idx):
         knext.Effect.SHOW
     )
 
-    string_type = type(f'String{filter_idx}', (), {})
-    decorator_cls = knext.parameter_group(label='String')
-    string = decorator_cls(string_type)()
+    string = _STRING_GROUP(type(f'String{filter_idx}', (), {}))()
     inject_string_parameters(string)
     string.rule(
         knext.OneOf(
@@ -280,6 +294,17 @@ def inject_filter_parameters(filter, filter_idx):
     filter.string = string
 
 
+def create_filter_config(filter) -> dict:
+    """Get the query configuration of a filter."""
+    operation_group = getattr(filter, _VALUE_TYPE_GROUPS[filter.value_type])
+    return {
+        'tag': filter.tag,
+        'value_type': filter.value_type,
+        'operation': KnimeToMdHOperationsMap[operation_group.operation],
+        'target': str(operation_group.target)
+    }
+
+
 @knext.parameter_group(label='Filter configuration')
 class FilterConfiguration:  # noqa[D101]
 
@@ -334,20 +359,21 @@ class MetadataQueryCreatorNode(knext.PythonNode):
     """
 
     _MAX_NUM_FILTERS = 20
-    _RE_FILTER_MATCHES = r'f\d+'
+    _FILTER_KEYS = tuple(f'f{i}' for i in range(_MAX_NUM_FILTERS + 1))
+    _RE_FILTER_MATCHES = re.compile(r'f\d+')
 
     filter_configuration = FilterConfiguration()
 
     def __init__(self):
         """Create simple or complex metadata queries for downstream query nodes."""
         filter = self._create_filter_and_inject_parameters(0)
-        setattr(self, 'f0', filter)
+        setattr(self, self._FILTER_KEYS[0], filter)
         last_filter = filter
 
         for i in range(1, self._MAX_NUM_FILTERS + 1):
             filter = self._create_filter_and_inject_parameters(i)
             filter.rule(TagIsNotEmpty(last_filter), knext.Effect.SHOW)
-            setattr(self, f'f{i}', filter)
+            setattr(self, self._FILTER_KEYS[i], filter)
             last_filter = filter
 
     def _create_filter_and_inject_parameters(self, filter_idx: int):
@@ -358,16 +384,9 @@ class MetadataQueryCreatorNode(knext.PythonNode):
         return filter
 
     def _get_filters(self):
-        vars_ = vars(self)
         filters = []
-        for filter_key in vars_:
-            if not filter_key.startswith('f'):
-                continue
-
-            with contextlib.suppress(ValueError):
-                int(filter_key[1:])
-
-            filter = vars_[filter_key]
+        for filter_key in self._FILTER_KEYS:
+            filter = getattr(self, filter_key)
 
             if not filter.tag:
                 continue
@@ -382,7 +401,7 @@ class MetadataQueryCreatorNode(knext.PythonNode):
     ):
         """Node configuration."""
         filter_logic = self.filter_configuration.filter_logic
-        filter_matches = set(re.findall(self._RE_FILTER_MATCHES, filter_logic))
+        filter_matches = set(self._RE_FILTER_MATCHES.findall(filter_logic))
         for filter_key, filter in self._get_filters():
             if filter_key not in filter_matches:
                 config_context.set_warning(
@@ -406,18 +425,20 @@ class MetadataQueryCreatorNode(knext.PythonNode):
         query = {
             'filter_logic': filter_logic,
             'limit': limit if limit != 0 else None,
-            'offset': offset,
-            'filters': []
+            'offset': offset
         }
 
         if not selected_tags:
             query['selected_tags'] = []
         else:
-            query['selected_tags'] = \
-                [selected_tag.strip() for selected_tag in selected_tags.split(',')]
-
-        filter_matches = set(re.findall(self._RE_FILTER_MATCHES, filter_logic))
-        for filter_key, filter in self._get_filters():
+            # Deduplicate while keeping the order of the selected tags
+            query['selected_tags'] = list(dict.fromkeys(
+                selected_tag.strip() for selected_tag in selected_tags.split(',')
+            ))
+
+        filters = self._get_filters()
+        filter_matches = set(self._RE_FILTER_MATCHES.findall(filter_logic))
+        for filter_key, _ in filters:
             if filter_key not in filter_matches:
                 raise RuntimeError(
                     Messages.QUERY_VALID_FILTER_LOGIC.format(
@@ -425,18 +446,8 @@ class MetadataQueryCreatorNode(knext.PythonNode):
                         filter_logic=filter_logic
                     )
                 )
-            operation_group = filter.string
-            if filter.value_type == TagTypeOptions.NUMBER.name:
-                operation_group = filter.number
-            if filter.value_type == TagTypeOptions.DATE.name:
-                operation_group = filter.date
-
-            query['filters'].append({
-                'tag': filter.tag,
-                'value_type': filter.value_type,
-                'operation': getattr(KnimeToMdHOperationsMap, operation_group.operation),
-                'target': str(operation_group.target)
-            })
+
+        query['filters'] = [create_filter_config(filter) for _, filter in filters]
 
         return MdHMetadataQueryPortObject(
             MdHMetadataQueryPortObjectSpec(METADATA_QUERY_TYPE.id),
@@ -1,19 +1,18 @@
 """Statistic nodes."""
 
 # Python imports
-import contextlib
 import logging
 from types import ModuleType
-from typing import Callable
+from typing import Callable, Final
 
 # 3rd party imports
 import knime.extension as knext
 import pandas as pd
 
 # Local imports
+from .categories import CATEGORIES
 import mdh
 from mdh.errors import MdHApiError
-from mdh.types.connection import GlobalSearchHeaders
 from mdh.types.statistic import (
     StatisticFileTypesParameters,
     StatisticMetadataTagsParameters,
@@ -25,21 +24,15 @@ from ports.instance_connection import (
     MdHInstanceConnectionPortObjectSpec
 )
 from utils.mdh import (  # noqa[I100,I201]
-    mdh_instance_is_global_search,
-    mdh_instance_is_running
+    get_global_search_headers,
+    mdh_instance_status
 )
 from utils.message import Messages
 from utils.parameter import FlowVariables
 
 LOGGER = logging.getLogger(__name__)
 
-__category = knext.category(
-    path='/community/mdh',
-    level_id='statistics',
-    name='Statistics',
-    description='MdH Statistic Nodes.',
-    icon='icons/mdh.png',
-)
+__category = CATEGORIES['statistics']
 
 ####################
 # Parameter Groups #
@@ -64,13 +57,55 @@ class StatisticOptions(knext.EnumParameterOptions):  # noqa[D101]
     )
 
 
+_FILETYPE: Final[str] = StatisticOptions.FILETYPE.name  # type: ignore[attr-defined]
+_MIMETYPE: Final[str] = StatisticOptions.MIMETYPE.name  # type: ignore[attr-defined]
+_METADATA: Final[str] = StatisticOptions.METADATA.name  # type: ignore[attr-defined]
+
+# Statistic module method name and parameter type per statistic option
+_STATISTIC_METHODS = {
+    _FILETYPE: (
+        'get_filetype',
+        StatisticFileTypesParameters
+    ),
+    _MIMETYPE: (
+        'get_mimetype',
+        StatisticMimeTypesParameters
+    ),
+    _METADATA: (
+        'get_metadata',
+        StatisticMetadataTagsParameters
+    )
+}
+
+# Mapping of MdH statistic keys to table columns per statistic option
+_STATISTIC_COLUMNS = {
+    _FILETYPE: {
+        'name': 'FileType',
+        'metadataCount': 'MetadataCount',
+        'metadataCountAggregatedValues': 'MetadataCountAggregatedValues',
+        'fileCount': 'FileCount',
+        'space': 'Space (in bytes)'
+    },
+    _MIMETYPE: {
+        'name': 'MIMEType',
+        'fileCount': 'FileCount',
+        'space': 'Space (in bytes)'
+    },
+    _METADATA: {
+        'name': 'Tag',
+        'type': 'DataType',
+        'count': 'TagCount'
+    }
+}
+
+
 @knext.parameter_group(label='Parameter')
 class MetadataStatisticParameter:  # noqa[D101]
 
     statistic_selection_param = knext.EnumParameter(
         'Statistic Option',
         'Choose one of the statistic options.',
-        default_value=StatisticOptions.FILETYPE.name,  # type: ignore[attr-defined]
+        default_value=_FILETYPE,
         enum=StatisticOptions
     )
     limit = knext.IntParameter(
@@ -120,54 +155,20 @@ class StatisticNode(knext.PythonNode):
         StatisticMetadataTagsParameters
     ]:
         """Get the method and parameter type of corresponding statistics module."""
-        if (selection_param == StatisticOptions.FILETYPE.name):  # type: ignore[attr-defined]
-            return (statistic_module.get_filetype, StatisticFileTypesParameters)
-        if (selection_param == StatisticOptions.MIMETYPE.name):  # type: ignore[attr-defined]
-            return (statistic_module.get_mimetype, StatisticMimeTypesParameters)
-        return (statistic_module.get_metadata, StatisticMetadataTagsParameters)
+        method_name, parameter_type = _STATISTIC_METHODS[selection_param]
+        return (getattr(statistic_module, method_name), parameter_type)
 
     def _get_statistic_data(
         self,
         result: list[dict],
         selection_param: str
-    ):
-        def try_append(column: list, entry: dict, key: str) -> None:
-            with contextlib.suppress(KeyError):
-                column.append(entry[key])
-        type_ = []
-        file_count = []
-        metadata_count = []
-        tag_count = []
-        data_type = []
-        space = []
-        metadata_count_aggregated_values = []
-
-        for entry in result:
-            try_append(type_, entry, 'name')
-            try_append(file_count, entry, 'fileCount')
-            try_append(data_type, entry, 'type')
-            try_append(tag_count, entry, 'count')
-            try_append(metadata_count, entry, 'metadataCount')
-            try_append(space, entry, 'space')
-            try_append(metadata_count_aggregated_values, entry, 'metadataCountAggregatedValues')
-
-        data = {}
-        if (selection_param == StatisticOptions.FILETYPE.name):  # type: ignore[attr-defined]
-            data['FileType'] = type_
-            data['MetadataCount'] = metadata_count
-            data['MetadataCountAggregatedValues'] = metadata_count_aggregated_values
-            data['FileCount'] = file_count
-            data['Space (in bytes)'] = space
-        elif (selection_param == StatisticOptions.MIMETYPE.name):  # type: ignore[attr-defined]
-            data['MIMEType'] = type_
-            data['FileCount'] = file_count
-            data['Space (in bytes)'] = space
-        else:
-            data['Tag'] = type_
-            data['DataType'] = data_type
-            data['TagCount'] = tag_count
-
-        return data
+    ) -> pd.DataFrame:
+        """Get the statistic table of the selected statistic option."""
+        column_map = _STATISTIC_COLUMNS[selection_param]
+        return pd.DataFrame.from_records(
+            result,
+            columns=list(column_map)
+        ).rename(columns=column_map)
 
     def configure(
         self,
@@ -185,8 +186,8 @@ class StatisticNode(knext.PythonNode):
         """Node execution."""
         instance = mdh_connection.data[FlowVariables.INSTANCE]
 
-        is_global_search = mdh_instance_is_global_search(instance)
-        if not mdh_instance_is_running(instance, is_global_search):
+        is_global_search, is_running = mdh_instance_status(instance)
+        if not is_running:
             raise RuntimeError(
                 Messages.ADD_RUNNING_INSTANCE_BY_NAME.format(instance=instance)
             )
@@ -207,11 +208,7 @@ class StatisticNode(knext.PythonNode):
                 result = func(
                     instance,
                     parameters=parameters(limit=limit),
-                    global_search_headers=GlobalSearchHeaders(
-                        mdh_connection.data[FlowVariables.SELECTED_CORES],
-                        mdh_connection.data[FlowVariables.IGNORE_ERRORS],
-                        mdh_connection.data[FlowVariables.IGNORE_FAILED_CONS]
-                    )
+                    global_search_headers=get_global_search_headers(mdh_connection.data)
                 )
             else:
                 result = func(
@@ -222,11 +219,9 @@ class StatisticNode(knext.PythonNode):
             LOGGER.error(str(err))
             raise
 
-        data = self._get_statistic_data(
-            result,
-            self.parameter.statistic_selection_param
-        )
-
         return knext.Table.from_pandas(
-            pd.DataFrame(data)
+            self._get_statistic_data(
+                result,
+                self.parameter.statistic_selection_param
+            )
         )
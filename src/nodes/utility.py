@@ -5,9 +5,10 @@ import logging
 
 # 3rd party imports
 import knime.extension as knext
-import pandas as pd
+import pyarrow as pa
 
 # Local imports
+from .categories import CATEGORIES
 import mdh
 from ports.instance_connection import (
     INSTANCE_CONNECTION_TYPE,
@@ -16,8 +17,7 @@ from ports.instance_connection import (
 )
 from utils.mdh import (  # noqa[I100,I201]
     get_global_search_headers,
-    mdh_instance_is_global_search,
-    mdh_instance_is_running
+    mdh_instance_status
 )
 from utils.message import Messages
 from utils.parameter import FlowVariables
@@ -26,13 +26,7 @@ from utils.parameter import FlowVariables
 LOGGER = logging.getLogger(__name__)
 
 
-__category = knext.category(
-    path='/community/mdh',
-    level_id='utility',
-    name='Utility',
-    description='MdH Utility Nodes.',
-    icon='icons/mdh.png',
-)
+__category = CATEGORIES['utility']
 
 
 #################
@@ -77,8 +71,8 @@ class InfoNode(knext.PythonNode):
         """Node execution."""
         instance = mdh_connection.data[FlowVariables.INSTANCE]
 
-        is_global_search = mdh_instance_is_global_search(instance)
-        if not mdh_instance_is_running(instance, is_global_search):
+        is_global_search, is_running = mdh_instance_status(instance)
+        if not is_running:
             raise RuntimeError(
                 Messages.ADD_RUNNING_INSTANCE_BY_NAME.format(instance=instance)
             )
@@ -91,9 +85,6 @@ class InfoNode(knext.PythonNode):
         else:
             result = mdh.core.main.info(instance)
 
-        data = {}
-        for key, value in result.items():
-            data[key[0].upper() + key[1:]] = value
+        data = {key[0].upper() + key[1:]: value for key, value in result.items()}
 
-        df = pd.DataFrame(data, index=[0])
-        return knext.Table.from_pandas(df)
+        return knext.Table.from_pyarrow(pa.Table.from_pylist([data]))
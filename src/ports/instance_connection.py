@@ -5,6 +5,7 @@ import pickle
 
 # 3rd party imports
 import knime.extension as knext
+import orjson
 
 
 class MdHInstanceConnectionPortObjectSpec(knext.BinaryPortObjectSpec):
@@ -27,7 +28,7 @@ class MdHInstanceConnectionPortObject(knext.PortObject):
 
     def serialize(self) -> bytes:
         """Serializes the object to bytes."""
-        return pickle.dumps(self._data)
+        return orjson.dumps(self._data)
 
     @classmethod
     def deserialize(
@@ -36,7 +37,10 @@ class MdHInstanceConnectionPortObject(knext.PortObject):
         data: bytes
     ) -> 'MdHInstanceConnectionPortObject':
         """Creates the port object from its spec and storage."""
-        return cls(spec, pickle.loads(data))
+        # Ports saved by earlier versions of the extension are pickled
+        if not data.startswith(b'{'):
+            return cls(spec, pickle.loads(data))
+        return cls(spec, orjson.loads(data))
 
     @property
     def data(self) -> dict:
@@ -1,8 +1,13 @@
 """MdH specific utils."""
 
 # Python imports
+import functools
 import logging
+import os
 import re
+import threading
+import time
+from typing import Callable, Final, NamedTuple
 
 # Local imports
 import mdh
@@ -17,27 +22,94 @@ from .parameter import FlowVariables
 
 LOGGER = logging.getLogger(__name__)
 
+_DEFAULT_DISCOVERY_CACHE_TTL: Final[float] = 30.0
+
+
+def _get_discovery_cache_ttl() -> float:
+    """Get the discovery cache TTL in seconds, overridable via `MDH_DISCOVERY_CACHE_TTL`."""
+    try:
+        return float(os.environ.get('MDH_DISCOVERY_CACHE_TTL', _DEFAULT_DISCOVERY_CACHE_TTL))
+    except ValueError:
+        LOGGER.warning(
+            ' Invalid MDH_DISCOVERY_CACHE_TTL, falling back to %s seconds',
+            _DEFAULT_DISCOVERY_CACHE_TTL
+        )
+    return _DEFAULT_DISCOVERY_CACHE_TTL
+
+
+DISCOVERY_CACHE_TTL: Final[float] = _get_discovery_cache_ttl()
+
+_CORE_CACHE_KEY: Final[str] = 'core'
+_GLOBAL_SEARCH_CACHE_KEY: Final[str] = 'global_search'
+_ALL_GLOBAL_SEARCH_CACHE_KEY: Final[str] = 'all_global_search'
+
+_discovery_cache: dict[str, tuple[list[str], float]] = {}
+_discovery_cache_lock = threading.Lock()
+
+
+def invalidate_discovery_cache(key: str | None = None) -> None:
+    """Drop cached MdH Instance discovery results.
+
+    :param key: only drop the results stored under this cache key, defaults to all results
+    """
+    with _discovery_cache_lock:
+        if key is None:
+            _discovery_cache.clear()
+        else:
+            _discovery_cache.pop(key, None)
+
+
+def _get_cached_names(key: str, discover: Callable[[], list[str]]) -> list[str]:
+    """Get instance names from the discovery cache or run the discovery.
+
+    :param key: the cache key
+    :param discover: callable performing the actual MdH discovery request
+    """
+    with _discovery_cache_lock:
+        cached = _discovery_cache.get(key)
+        if cached is not None and cached[1] > time.monotonic():
+            return list(cached[0])
+
+    names = discover()
+    with _discovery_cache_lock:
+        _discovery_cache[key] = (names, time.monotonic() + DISCOVERY_CACHE_TTL)
+    return list(names)
+
 
 def get_running_mdh_core_names() -> list[str]:
-    """Get names of running MdH Core Instances."""
+    """Get names of running MdH Core Instances.
+
+    Results are cached for `DISCOVERY_CACHE_TTL` seconds.
+    """
     try:
-        cores = mdh.core.main.get(only_running=True)  # type: ignore[attr-defined]
+        return _get_cached_names(
+            _CORE_CACHE_KEY,
+            lambda: [
+                core.name
+                for core in mdh.core.main.get(only_running=True)  # type: ignore[attr-defined]
+            ]
+        )
     except (MdHNotInitializedError, MdHEnvironmentError) as err:
         LOGGER.error(str(err))
-    else:
-        return [core.name for core in cores]
     return []
 
 
 def get_running_mdh_global_search_names() -> list[str]:
-    """Get names of running MdH Global Search Instances."""
+    """Get names of running MdH Global Search Instances.
+
+    Results are cached for `DISCOVERY_CACHE_TTL` seconds.
+    """
     try:
-        global_searches = \
-            mdh.global_search.main.get(only_running=True)  # type: ignore[attr-defined]
+        return _get_cached_names(
+            _GLOBAL_SEARCH_CACHE_KEY,
+            lambda: [
+                global_search.name
+                for global_search in
+                mdh.global_search.main.get(only_running=True)  # type: ignore[attr-defined]
+            ]
+        )
     except (MdHNotInitializedError, MdHEnvironmentError) as err:
         LOGGER.error(str(err))
-    else:
-        return [global_search.name for global_search in global_searches]
     return []
 
 
@@ -48,25 +120,84 @@ def mdh_instance_is_running(name: str, is_global_search: bool) -> bool:
     :param is_global_search: if the MdH Instance is a `Global Search`
 
     """
+    if not name:
+        return False
+
     if is_global_search:
         func = get_running_mdh_global_search_names  # type: ignore[attr-defined]
+        key = _GLOBAL_SEARCH_CACHE_KEY
     else:
         func = get_running_mdh_core_names  # type: ignore[attr-defined]
+        key = _CORE_CACHE_KEY
 
-    return any(instance == name for instance in func())
+    if name in func():
+        return True
+
+    # A miss might stem from a stale discovery cache, e.g. for a freshly started instance
+    invalidate_discovery_cache(key)
+    return name in func()
 
 
 def mdh_instance_is_global_search(name: str) -> bool:
     """Check if the MdH Instance is a `Global Search`.
 
+    Known `Global Search` instances are cached for `DISCOVERY_CACHE_TTL` seconds.
+
     :param name: the name of the MdH Instance
     """
+    if not name:
+        return False
+
     try:
-        global_searches = mdh.global_search.main.get()
+        global_searches = _get_cached_names(
+            _ALL_GLOBAL_SEARCH_CACHE_KEY,
+            lambda: [
+                global_search.name
+                for global_search in mdh.global_search.main.get()  # type: ignore[attr-defined]
+            ]
+        )
     except (MdHNotInitializedError, MdHEnvironmentError) as err:
         raise RuntimeError(str(err))
 
-    return any(global_search.name == name for global_search in global_searches)
+    return name in global_searches
+
+
+class InstanceStatus(NamedTuple):
+    """Kind and running state of a MdH Instance."""
+
+    is_global_search: bool
+    is_running: bool
+
+
+def mdh_instance_status(name: str) -> InstanceStatus:
+    """Get the kind and the running state of a MdH Instance.
+
+    Running instances are resolved via the discovery cache, the list of all
+    `Global Search` instances is only requested if the instance is not running.
+
+    :param name: the name of the MdH Instance
+    """
+    if not name:
+        return InstanceStatus(is_global_search=False, is_running=False)
+
+    for refresh in (False, True):
+        if refresh:
+            # A miss might stem from a stale discovery cache, e.g. for a freshly started instance
+            invalidate_discovery_cache()
+        if name in get_running_mdh_global_search_names():
+            return InstanceStatus(is_global_search=True, is_running=True)
+        if name in get_running_mdh_core_names():
+            return InstanceStatus(is_global_search=False, is_running=True)
+
+    return InstanceStatus(
+        is_global_search=mdh_instance_is_global_search(name),
+        is_running=False
+    )
+
+
+_DOWNLOAD_FORMAT_VALUES: Final[frozenset[str]] = frozenset(
+    e.value for e in DownloadFormat  # type: ignore[attr-defined]
+)
 
 
 def mdh_download_format_exists(download_format: str) -> bool:
@@ -74,9 +205,7 @@ def mdh_download_format_exists(download_format: str) -> bool:
 
     :param download_format: download format
     """
-    return any(
-        e.value == download_format for e in DownloadFormat  # type: ignore[attr-defined]
-    )
+    return download_format in _DOWNLOAD_FORMAT_VALUES
 
 
 def get_global_search_headers(
@@ -93,17 +222,29 @@ def get_global_search_headers(
     )
 
 
+_RE_CORE_SEPARATORS = re.compile(r'[^a-zA-Z0-9-_]+')
+
+
+@functools.lru_cache(maxsize=16)
+def _split_global_search_cores(cores: str) -> tuple[str, ...]:
+    """Split the comma seperated string of MdH Cores (memoized).
+
+    :param cores: comma seperated MdH Cores
+    """
+    return tuple(
+        core
+        for core in _RE_CORE_SEPARATORS.split(cores)
+        if core != ''
+    )
+
+
 def split_global_search_cores(cores: str) -> list[str]:
     """Split the comma seperated string of MdH Cores.
 
     :param cores: comma seperated MdH Cores
     :raises RuntimeError: if no MdH Core candidate string could be extracted
     """
-    cores = [
-        core
-        for core in re.split(r'[^a-zA-Z0-9-_]+', cores)
-        if core != ''
-    ]
-    if not cores:
+    split_cores = _split_global_search_cores(cores)
+    if not split_cores:
         raise RuntimeError('Please provide a minimum of one MdH Core Instance')
-    return cores
+    return list(split_cores)